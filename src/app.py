@@ -19,61 +19,61 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are stored as sets for O(1) lookups)
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Competitive basketball training and games",
         "schedule": "Mondays, Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu"]
+        "participants": {"james@mergington.edu"}
     },
     "Tennis Club": {
         "description": "Learn tennis techniques and participate in matches",
         "schedule": "Tuesdays, Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 10,
-        "participants": ["lucas@mergington.edu", "ava@mergington.edu"]
+        "participants": {"lucas@mergington.edu", "ava@mergington.edu"}
     },
     "Art Studio": {
         "description": "Explore painting, drawing, and mixed media techniques",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["isabella@mergington.edu"]
+        "participants": {"isabella@mergington.edu"}
     },
     "Drama Club": {
         "description": "Theatre arts, acting, and stage performance",
         "schedule": "Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["mia@mergington.edu", "gabriel@mergington.edu"]
+        "participants": {"mia@mergington.edu", "gabriel@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking skills",
         "schedule": "Mondays, Fridays, 3:30 PM - 4:30 PM",
         "max_participants": 14,
-        "participants": ["alexander@mergington.edu"]
+        "participants": {"alexander@mergington.edu"}
     },
     "Science Club": {
         "description": "Conduct experiments and explore STEM concepts",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["noah@mergington.edu", "charlotte@mergington.edu"]
+        "participants": {"noah@mergington.edu", "charlotte@mergington.edu"}
     }
 }
 
@@ -85,7 +85,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Serialize participant sets as sorted lists for stable output
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +107,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -122,5 +126,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is not registered")
 
     # Remove student
-    activity["participants"].remove(email)
+    activity["participants"].discard(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
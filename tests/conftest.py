@@ -0,0 +1,62 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import copy
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, activities
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a single test client for the FastAPI app, shared across the module"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def _pristine_participants():
+    """Pair each live participants set with a snapshot of its initial contents"""
+    return tuple(
+        (name, details["participants"], copy.deepcopy(details["participants"]))
+        for name, details in activities.items()
+    )
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient():
+    """Create an async client that drives the ASGI app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture
+def reset_activities(_pristine_participants):
+    """Restore activities to their initial state after each test"""
+    yield
+
+    # Reset in place so the cached set handles stay valid
+    for _, participants, snapshot in _pristine_participants:
+        participants.clear()
+        participants.update(snapshot)
+
+
+@pytest.fixture
+def assert_activities_unchanged(_pristine_participants):
+    """Return a check that every activity still has its initial participants"""
+    def check():
+        for name, participants, snapshot in _pristine_participants:
+            assert participants == snapshot, f"Participants of {name} changed"
+
+    return check
@@ -2,56 +2,66 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+from urllib.parse import quote
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities, signup_for_activity, unregister_from_activity
 
-from app import app, activities
+NONEXISTENT_ACTIVITY = "Nonexistent Club"
 
+# Endpoint URLs are built once at import rather than per request
+SIGNUP_URLS = {
+    name: f"/activities/{quote(name)}/signup" for name in (*activities, NONEXISTENT_ACTIVITY)
+}
+UNREGISTER_URLS = {
+    name: f"/activities/{quote(name)}/unregister" for name in (*activities, NONEXISTENT_ACTIVITY)
+}
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
+def _json(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    original_participants = {
-        activity: details["participants"].copy()
-        for activity, details in activities.items()
-    }
-    
-    yield
-    
-    # Reset after test
-    for activity, details in activities.items():
-        details["participants"] = original_participants[activity]
+
+# (activity, email, expected status, expected message or error detail)
+SIGNUP_CASES = [
+    ("Chess Club", "newstudent@mergington.edu", 200,
+     "Signed up newstudent@mergington.edu for Chess Club"),
+    ("Programming Class", "newprogrammer@mergington.edu", 200,
+     "Signed up newprogrammer@mergington.edu for Programming Class"),
+    ("Tennis Club", "john.doe+test@mergington.edu", 200,  # special characters in email
+     "Signed up john.doe+test@mergington.edu for Tennis Club"),
+    ("Programming Class", "coder@mergington.edu", 200,
+     "Signed up coder@mergington.edu for Programming Class"),
+    ("Chess Club", "michael@mergington.edu", 400, "Student already signed up"),
+]
+
+
+@pytest.fixture(scope="module")
+def activities_response(client):
+    """Fetch and decode GET /activities once for the read-only tests"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return _json(response)
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
+    def test_get_activities_returns_all_activities(self, activities_response):
         """Test that all activities are returned"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        
-        data = response.json()
+        data = activities_response
         assert len(data) == 9
         assert "Chess Club" in data
         assert "Programming Class" in data
         assert "Gym Class" in data
     
-    def test_get_activities_includes_activity_details(self, client, reset_activities):
+    def test_get_activities_includes_activity_details(self, activities_response):
         """Test that activity details are included"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response
         
         chess_club = data["Chess Club"]
         assert "description" in chess_club
@@ -59,10 +69,9 @@ class TestGetActivities:
         assert "max_participants" in chess_club
         assert "participants" in chess_club
     
-    def test_get_activities_includes_participants(self, client, reset_activities):
+    def test_get_activities_includes_participants(self, activities_response):
         """Test that participants are included in the response"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response
         
         chess_club = data["Chess Club"]
         assert len(chess_club["participants"]) > 0
@@ -72,64 +81,45 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_for_activity_success(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": "newstudent@mergington.edu"}
-        )
-        assert response.status_code == 200
-        assert "Signed up newstudent@mergington.edu for Chess Club" in response.json()["message"]
-        
-        # Verify participant was added
-        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
-    
-    def test_signup_for_nonexistent_activity(self, client, reset_activities):
+    @pytest.mark.parametrize("activity,email,expected_status,expected_detail", SIGNUP_CASES,
+                             ids=[f"{activity}-{email}" for activity, email, _, _ in SIGNUP_CASES])
+    def test_signup_matrix(self, client, reset_activities, assert_activities_unchanged,
+                           activity, email, expected_status, expected_detail):
+        """Test signup outcomes for each (activity, email) case"""
+        before = set(activities[activity]["participants"])
+        
+        response = client.post(SIGNUP_URLS[activity], params={"email": email})
+        assert response.status_code == expected_status
+        
+        if expected_status == 200:
+            assert expected_detail in _json(response)["message"]
+            # Verify exactly this participant was added
+            assert activities[activity]["participants"] == before | {email}
+        else:
+            assert _json(response)["detail"] == expected_detail
+            assert_activities_unchanged()
+    
+    def test_signup_for_nonexistent_activity(self, client, assert_activities_unchanged):
         """Test signup for non-existent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent Club/signup",
+            SIGNUP_URLS[NONEXISTENT_ACTIVITY],
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-    
-    def test_signup_duplicate_participant(self, client, reset_activities):
-        """Test that duplicate signup is prevented"""
-        email = "michael@mergington.edu"  # Already registered for Chess Club
-        
-        response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
-        )
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student already signed up"
-    
-    def test_signup_increases_participant_count(self, client, reset_activities):
-        """Test that signup increases the participant count"""
-        initial_count = len(activities["Programming Class"]["participants"])
-        
-        client.post(
-            "/activities/Programming Class/signup",
-            params={"email": "newprogrammer@mergington.edu"}
-        )
-        
-        final_count = len(activities["Programming Class"]["participants"])
-        assert final_count == initial_count + 1
+        assert _json(response)["detail"] == "Activity not found"
+        assert_activities_unchanged()
     
-    def test_signup_multiple_different_activities(self, client, reset_activities):
+    @pytest.mark.anyio
+    async def test_signup_multiple_different_activities(self, aclient, reset_activities):
         """Test signing up for multiple different activities"""
         email = "versatile@mergington.edu"
         
-        response1 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+        # The two signups are independent, so issue them concurrently
+        response1, response2 = await asyncio.gather(
+            aclient.post(SIGNUP_URLS["Chess Club"], params={"email": email}),
+            aclient.post(SIGNUP_URLS["Art Studio"], params={"email": email}),
         )
         assert response1.status_code == 200
-        
-        response2 = client.post(
-            "/activities/Art Studio/signup",
-            params={"email": email}
-        )
         assert response2.status_code == 200
         
         # Verify registered in both
@@ -146,90 +136,61 @@ class TestUnregisterFromActivity:
         initial_count = len(activities["Chess Club"]["participants"])
         
         response = client.post(
-            "/activities/Chess Club/unregister",
+            UNREGISTER_URLS["Chess Club"],
             params={"email": email}
         )
         assert response.status_code == 200
-        assert f"Unregistered {email} from Chess Club" in response.json()["message"]
+        assert f"Unregistered {email} from Chess Club" in _json(response)["message"]
         
         # Verify participant was removed
-        assert email not in activities["Chess Club"]["participants"]
-        assert len(activities["Chess Club"]["participants"]) == initial_count - 1
+        participants = activities["Chess Club"]["participants"]
+        assert email not in participants
+        assert len(participants) == initial_count - 1
     
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
+    def test_unregister_nonexistent_activity(self, client, assert_activities_unchanged):
         """Test unregister from non-existent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent Club/unregister",
+            UNREGISTER_URLS[NONEXISTENT_ACTIVITY],
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
+        assert _json(response)["detail"] == "Activity not found"
+        assert_activities_unchanged()
     
-    def test_unregister_not_registered_participant(self, client, reset_activities):
+    def test_unregister_not_registered_participant(self, client, reset_activities,
+                                                   assert_activities_unchanged):
         """Test unregister for non-registered participant returns 400"""
         response = client.post(
-            "/activities/Chess Club/unregister",
+            UNREGISTER_URLS["Chess Club"],
             params={"email": "notregistered@mergington.edu"}
         )
         assert response.status_code == 400
-        assert response.json()["detail"] == "Student is not registered"
+        assert _json(response)["detail"] == "Student is not registered"
+        assert_activities_unchanged()
     
-    def test_unregister_then_signup_again(self, client, reset_activities):
+    def test_unregister_then_signup_again(self, reset_activities):
         """Test that a student can re-signup after unregistering"""
+        # Pure state transitions, so call the route handlers directly
         email = "testuser@mergington.edu"
         activity = "Chess Club"
+        participants = activities[activity]["participants"]
         
-        # Sign up
-        response1 = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        assert response1.status_code == 200
-        assert email in activities[activity]["participants"]
+        signup_for_activity(activity, email)
+        assert email in participants
         
-        # Unregister
-        response2 = client.post(
-            f"/activities/{activity}/unregister",
-            params={"email": email}
-        )
-        assert response2.status_code == 200
-        assert email not in activities[activity]["participants"]
+        unregister_from_activity(activity, email)
+        assert email not in participants
         
-        # Sign up again
-        response3 = client.post(
-            f"/activities/{activity}/signup",
-            params={"email": email}
-        )
-        assert response3.status_code == 200
-        assert email in activities[activity]["participants"]
+        signup_for_activity(activity, email)
+        assert email in participants
 
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios"""
     
-    def test_email_with_special_characters(self, client, reset_activities):
-        """Test signup with email containing special characters"""
-        email = "john.doe+test@mergington.edu"
-        
-        response = client.post(
-            "/activities/Tennis Club/signup",
-            params={"email": email}
-        )
-        assert response.status_code == 200
-        assert email in activities["Tennis Club"]["participants"]
-    
-    def test_activity_name_with_special_characters(self, client, reset_activities):
-        """Test that activity names with spaces are handled correctly"""
-        response = client.post(
-            "/activities/Programming Class/signup",
-            params={"email": "coder@mergington.edu"}
-        )
-        assert response.status_code == 200
-    
-    def test_get_activities_structure(self, client, reset_activities):
+    def test_get_activities_structure(self, activities_response):
         """Test that activity data structure is consistent"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response
         
         for activity_name, activity_data in data.items():
             assert isinstance(activity_name, str)
@@ -240,3 +201,4 @@ class TestEdgeCases:
             assert isinstance(activity_data["max_participants"], int)
             assert "participants" in activity_data
             assert isinstance(activity_data["participants"], list)
+            assert activity_data["participants"] == sorted(activity_data["participants"])